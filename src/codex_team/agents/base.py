@@ -3,13 +3,48 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import weakref
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from openai import OpenAI
+from aiolimiter import AsyncLimiter
+from openai import AsyncOpenAI, RateLimitError
 
 from ..communication import Channel, Message, PubSubBus
 from ..config import Settings, get_settings
+from ..transport import build_http_client
+
+# AsyncOpenAI clients are bound to the event loop they first run on, so the
+# shared pool is keyed per loop. Sharing one client per loop reuses its TCP
+# connection pool across every agent instead of opening sockets per agent.
+# The loop itself is the (weak) key — an id() could be recycled by a new
+# loop after the old one is collected — and clients are further keyed by
+# endpoint credentials so differing Settings never share a client. Dead
+# loops drop their clients with the weak entry.
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_shared_client(settings: Settings) -> AsyncOpenAI:
+    """Return the AsyncOpenAI client for the running event loop, creating it on first use."""
+
+    loop = asyncio.get_running_loop()
+    per_loop = _shared_clients.get(loop)
+    if per_loop is None:
+        per_loop = {}
+        _shared_clients[loop] = per_loop
+    key = (str(settings.litellm_base_url), settings.litellm_api_key)
+    client = per_loop.get(key)
+    if client is None:
+        client = AsyncOpenAI(
+            base_url=key[0],
+            api_key=key[1],
+            http_client=build_http_client(),
+        )
+        per_loop[key] = client
+    return client
 
 
 @dataclass
@@ -25,64 +60,102 @@ class AgentDescriptor:
 class AgentsClient:
     """Wrapper around the OpenAI Agents SDK for LiteLLM-backed models."""
 
+    _MAX_RETRIES = 5
+
     def __init__(self, settings: Optional[Settings] = None) -> None:
         self.settings = settings or get_settings()
-        self.client = OpenAI(
-            base_url=str(self.settings.litellm_base_url),
-            api_key=self.settings.litellm_api_key,
-        )
+        self._limiter = AsyncLimiter(self.settings.max_rpm, 60)
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        return _get_shared_client(self.settings)
+
+    async def _rate_limited(self, call: Any, **kwargs: Any) -> Any:
+        """Run one SDK call under the request limiter, retrying throttles.
+
+        On RateLimitError the retry-after header (plus jitter) drives a
+        per-call asyncio.sleep, so other coroutines keep flowing while this
+        one waits.
+        """
+
+        for attempt in range(self._MAX_RETRIES + 1):
+            async with self._limiter:
+                try:
+                    return await call(**kwargs)
+                except RateLimitError as exc:
+                    if attempt == self._MAX_RETRIES:
+                        raise
+                    retry_after = 1.0
+                    headers = getattr(getattr(exc, "response", None), "headers", None)
+                    if headers is not None:
+                        try:
+                            retry_after = float(headers.get("retry-after", retry_after))
+                        except (TypeError, ValueError):
+                            pass
+            await asyncio.sleep(retry_after + random.uniform(0.0, 0.5))
 
     async def create_agent(self, name: str, instructions: str, tools: Optional[List[Dict[str, Any]]] = None) -> AgentDescriptor:
         """Create an agent and a fresh thread for it."""
 
-        def _create() -> AgentDescriptor:
-            payload = {
-                "model": self.settings.litellm_model,
-                "name": name,
-                "instructions": instructions,
-                "tools": tools or [],
-            }
-            if self.settings.litellm_custom_provider:
-                payload["extra_body"] = {"custom_llm_provider": self.settings.litellm_custom_provider}
-            assistant = self.client.beta.assistants.create(**payload)
-            thread = self.client.beta.threads.create()
-            return AgentDescriptor(
-                assistant_id=assistant.id,
-                thread_id=thread.id,
-                name=name,
-                role=instructions.split("\n", 1)[0][:64],
-            )
-
-        return await asyncio.to_thread(_create)
+        payload = {
+            "model": self.settings.litellm_model,
+            "name": name,
+            "instructions": instructions,
+            "tools": tools or [],
+        }
+        if self.settings.litellm_custom_provider:
+            payload["extra_body"] = {"custom_llm_provider": self.settings.litellm_custom_provider}
+        assistant = await self._rate_limited(self.client.beta.assistants.create, **payload)
+        thread = await self._rate_limited(self.client.beta.threads.create)
+        return AgentDescriptor(
+            assistant_id=assistant.id,
+            thread_id=thread.id,
+            name=name,
+            role=instructions.split("\n", 1)[0][:64],
+        )
 
     async def send_message(self, descriptor: AgentDescriptor, content: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Send a message to the agent's thread and collect the response."""
 
-        def _send() -> Dict[str, Any]:
-            self.client.beta.threads.messages.create(
-                thread_id=descriptor.thread_id,
-                role="user",
-                content=content,
-                metadata=metadata,
-            )
-            run = self.client.beta.threads.runs.create(
+        await self._rate_limited(
+            self.client.beta.threads.messages.create,
+            thread_id=descriptor.thread_id,
+            role="user",
+            content=content,
+            metadata=metadata,
+        )
+        run = await self._rate_limited(
+            self.client.beta.threads.runs.create,
+            thread_id=descriptor.thread_id,
+            assistant_id=descriptor.assistant_id,
+        )
+        delay = 0.1
+        while True:
+            status = await self._rate_limited(
+                self.client.beta.threads.runs.retrieve,
                 thread_id=descriptor.thread_id,
-                assistant_id=descriptor.assistant_id,
+                run_id=run.id,
             )
-            while True:
-                status = self.client.beta.threads.runs.retrieve(
-                    thread_id=descriptor.thread_id,
-                    run_id=run.id,
-                )
-                if status.status in {"completed", "failed", "cancelled"}:
-                    break
-            messages = self.client.beta.threads.messages.list(thread_id=descriptor.thread_id)
-            return {
-                "run_status": status.status,
-                "messages": [m.model_dump() for m in messages.data],
-            }
-
-        return await asyncio.to_thread(_send)
+            if status.status in {"completed", "failed", "cancelled"}:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
+        # Only this run's messages, newest first — fetching the whole thread
+        # history would cost O(history) bytes per step on long threads.
+        messages = await self._rate_limited(
+            self.client.beta.threads.messages.list,
+            thread_id=descriptor.thread_id,
+            run_id=run.id,
+            order="desc",
+            limit=4,
+        )
+        # The SDK models are returned as-is; serializing every field with
+        # model_dump only to scan a couple of attributes downstream was a
+        # full Pydantic pass per message.
+        return {
+            "run_status": status.status,
+            "messages": messages.data,
+        }
 
 
 class BaseAgent:
@@ -3,37 +3,36 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..communication import Channel
+import msgspec
+
+from ..communication import Channel, Message
 from ..config import get_settings
 from ..codex_bridge import CodexSessionModel
+from ..jsonutil import find_json_object
 from .base import BaseAgent
 from .specialist import SpecialistAgent, SpecialistSpec
 
 
-@dataclass
-class CommunicationRule:
+class CommunicationRule(msgspec.Struct):
     """Defines check-in cadence and recipients."""
 
     interval_seconds: int
     channels: List[Channel]
 
 
-@dataclass
-class WorkflowStep:
+class WorkflowStep(msgspec.Struct):
     """Atomic unit of work orchestrated by the team."""
 
     name: str
     description: str
     role: str
-    depends_on: List[str] = field(default_factory=list)
+    depends_on: List[str] = msgspec.field(default_factory=list)
 
 
-@dataclass
-class TeamPlan:
+class TeamPlan(msgspec.Struct):
     """Structured plan emitted by the orchestrator model."""
 
     mission_brief: str
@@ -43,8 +42,8 @@ class TeamPlan:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TeamPlan":
-        roles = [SpecialistSpec(**role) for role in data.get("roles", [])]
-        workflow = [WorkflowStep(**step) for step in data.get("workflow", [])]
+        roles = msgspec.convert(data.get("roles", []), List[SpecialistSpec], strict=False)
+        workflow = msgspec.convert(data.get("workflow", []), List[WorkflowStep], strict=False)
         comm_data = data.get("communication", {})
         channels = []
         for channel in comm_data.get("channels", [Channel.STATUS.value]):
@@ -66,6 +65,31 @@ class TeamPlan:
         )
 
 
+class PlanCache:
+    """Exact-match cache of previously synthesized plans.
+
+    Keys combine the goal with the orchestrator prompt and model so that
+    prompt or model changes invalidate old entries.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[TeamPlan, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def key(goal: str, system_prompt: str, model: str) -> str:
+        digest = hashlib.sha256()
+        for part in (goal, system_prompt, model):
+            digest.update(part.encode())
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[TeamPlan, Dict[str, Any]]]:
+        return self._entries.get(key)
+
+    def put(self, key: str, plan: TeamPlan, payload: Dict[str, Any]) -> None:
+        self._entries[key] = (plan, payload)
+
+
 class OrchestratorAgent(BaseAgent):
     """High-level coordinator that spawns specialist LiteLLM agents."""
 
@@ -78,9 +102,11 @@ class OrchestratorAgent(BaseAgent):
             agents_client=agents_client,
         )
         self.prompt = settings.orchestrator_system_prompt
+        self._workspace_root = settings.codex_workspace_root
         self.plan: Optional[TeamPlan] = None
+        self._plan_cache: Optional[PlanCache] = PlanCache() if settings.plan_cache_enabled else None
         self.specialists: Dict[str, SpecialistAgent] = {}
-        self._monitors: List[asyncio.Task[None]] = []
+        self._supervising = False
         self._latest_status: Dict[str, Dict[str, Any]] = {}
         self._alerts: List[Dict[str, Any]] = []
 
@@ -88,8 +114,20 @@ class OrchestratorAgent(BaseAgent):
         await self.boot(self.prompt)
 
     async def handle_user_goal(self, goal: str) -> TeamPlan:
-        """Ask the orchestrator model to synthesize a plan for `goal`."""
-
+        """Ask the orchestrator model to synthesize a plan for `goal`.
+
+        Resolved plans are cached per (goal, prompt, model); an exact hit
+        skips the planning LLM turn entirely.
+        """
+
+        cache_key = None
+        if self._plan_cache is not None:
+            cache_key = PlanCache.key(goal, self.prompt, self.settings.litellm_model)
+            cached = self._plan_cache.get(cache_key)
+            if cached is not None:
+                self.plan, payload = cached
+                await self.notify(Channel.PLAN, {"plan": payload, "cached": True})
+                return self.plan
         response = await self.send_model_message(
             content=(
                 "You are designing a Codex multi-agent workflow. "
@@ -100,6 +138,8 @@ class OrchestratorAgent(BaseAgent):
         messages = response.get("messages", [])
         payload = self._extract_json(messages)
         self.plan = TeamPlan.from_dict(payload)
+        if self._plan_cache is not None and cache_key is not None:
+            self._plan_cache.put(cache_key, self.plan, payload)
         await self.notify(Channel.PLAN, {"plan": payload})
         return self.plan
 
@@ -107,9 +147,11 @@ class OrchestratorAgent(BaseAgent):
         """Full orchestration pipeline for a single goal."""
 
         plan = await self.handle_user_goal(goal)
+        # Supervision must be listening before any step runs, or status
+        # updates and alerts emitted during execution are lost.
+        self._ensure_supervision()
         await self.spin_up_specialists()
         await self.assign_workflow()
-        self._ensure_supervision()
         return plan
 
     async def spin_up_specialists(self) -> None:
@@ -127,50 +169,91 @@ class OrchestratorAgent(BaseAgent):
         await asyncio.gather(*tasks)
 
     async def assign_workflow(self) -> None:
-        """Distribute workflow steps to matching specialists."""
+        """Execute workflow steps, parallelizing independent ones.
+
+        Steps are grouped into dependency layers; each layer runs
+        concurrently (bounded by `max_parallel_steps`) and the next layer
+        starts once the previous one finishes.
+        """
 
         if not self.plan:
             raise RuntimeError("Plan must exist before assigning workflow")
-        for step in self.plan.workflow:
-            specialist = self.specialists.get(step.role)
-            if not specialist:
-                continue
-            await specialist.receive_step(step)
+        semaphore = asyncio.Semaphore(self.settings.max_parallel_steps)
+
+        async def _run(specialist: SpecialistAgent, step: WorkflowStep) -> None:
+            async with semaphore:
+                await specialist.execute_step(step)
+
+        for layer in self._workflow_layers(self.plan.workflow):
+            tasks = []
+            for step in layer:
+                specialist = self.specialists.get(step.role)
+                if not specialist:
+                    continue
+                tasks.append(_run(specialist, step))
+            await asyncio.gather(*tasks)
+
+    @staticmethod
+    def _workflow_layers(workflow: List[WorkflowStep]) -> List[List[WorkflowStep]]:
+        """Topologically group steps so each layer only depends on earlier ones."""
+
+        known = {step.name for step in workflow}
+        done: set = set()
+        pending = list(workflow)
+        layers: List[List[WorkflowStep]] = []
+        while pending:
+            ready = [
+                step
+                for step in pending
+                if all(dep in done or dep not in known for dep in step.depends_on)
+            ]
+            if not ready:
+                # Cyclic or malformed dependencies: fall back to plan order.
+                layers.extend([step] for step in pending)
+                break
+            layers.append(ready)
+            done.update(step.name for step in ready)
+            pending = [step for step in pending if step not in ready]
+        return layers
 
     async def create_codex_session(self, spec: SpecialistSpec) -> CodexSessionModel:
-        workspace = f"{self.settings.codex_workspace_root}/{spec.handle}"
+        workspace = f"{self._workspace_root}/{spec.handle}"
         return CodexSessionModel(workspace=workspace, agent_name=spec.handle)
 
     def _ensure_supervision(self) -> None:
-        if self._monitors:
+        # Callback subscribers: status/alert recording is a plain dict or
+        # list write, so no monitor task or queue hop is needed per message.
+        if self._supervising:
             return
-        self._monitors.append(asyncio.create_task(self._monitor_channel(Channel.STATUS)))
-        self._monitors.append(asyncio.create_task(self._monitor_channel(Channel.ALERT)))
+        self.bus.subscribe_callback(Channel.STATUS, self._record_status)
+        self.bus.subscribe_callback(Channel.ALERT, self._record_alert)
+        self._supervising = True
 
     async def shutdown(self) -> None:
-        for task in self._monitors:
-            task.cancel()
-        await asyncio.gather(*self._monitors, return_exceptions=True)
-        self._monitors.clear()
-
-    async def _monitor_channel(self, channel: Channel) -> None:
-        async for message in self.bus.subscribe(channel):
-            if channel == Channel.STATUS:
-                self._latest_status[message.sender] = message.payload
-            elif channel == Channel.ALERT:
-                self._alerts.append(message.payload)
-
-    def _extract_json(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Extract the last JSON object from model messages."""
-
-        for message in reversed(messages):
-            for item in message.get("content", []):
-                if item.get("type") == "output_text":
-                    text = item.get("text", "")
-                    try:
-                        return json.loads(text)
-                    except json.JSONDecodeError:
-                        continue
+        if self._supervising:
+            self.bus.unsubscribe_callback(Channel.STATUS, self._record_status)
+            self.bus.unsubscribe_callback(Channel.ALERT, self._record_alert)
+            self._supervising = False
+        await asyncio.gather(
+            *(specialist.shutdown() for specialist in self.specialists.values()),
+            return_exceptions=True,
+        )
+
+    def _record_status(self, message: Message) -> None:
+        self._latest_status[message.sender] = message.payload
+
+    def _record_alert(self, message: Message) -> None:
+        self._alerts.append(message.payload)
+
+    def _extract_json(self, messages: List[Any]) -> Dict[str, Any]:
+        """Extract the newest JSON object from model messages (newest first)."""
+
+        for message in messages:
+            for item in message.content or []:
+                if item.type == "output_text":
+                    payload = find_json_object(item.text or "")
+                    if isinstance(payload, dict):
+                        return payload
         raise ValueError("No JSON payload found in orchestrator response")
 
 
@@ -3,20 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
+import msgspec
+
 from ..codex_bridge import CodexBridge, CodexSessionModel
 from ..communication import Channel
+from ..jsonutil import find_json_object
 from .base import BaseAgent
 
 if TYPE_CHECKING:  # pragma: no cover - type only
     from .orchestrator import OrchestratorAgent, WorkflowStep
 
 
-@dataclass
-class SpecialistSpec:
+class SpecialistSpec(msgspec.Struct):
     """Describes a dynamically created specialist role."""
 
     handle: str
@@ -24,12 +24,18 @@ class SpecialistSpec:
     mission: str
     instructions: str
     check_in_seconds: int = 300
-    capabilities: List[str] = field(default_factory=list)
+    capabilities: List[str] = msgspec.field(default_factory=list)
 
 
 class SpecialistAgent(BaseAgent):
     """Bridges between the Agents SDK model and Codex CLI operations."""
 
+    _KNOWN_TOOLS = frozenset({"run_command", "read_file", "apply_patch"})
+    _ACTION_SCHEMA_NOTE = (
+        'When you produce actions, respond with JSON using the schema {"actions": [{"tool": str, "arguments": dict}]}.'
+    )
+    _STEP_PROMPT_SUFFIX = "Respond with JSON specifying Codex actions to take."
+
     def __init__(
         self,
         spec: SpecialistSpec,
@@ -44,41 +50,73 @@ class SpecialistAgent(BaseAgent):
         )
         self.spec = spec
         self.orchestrator = orchestrator
+        # Invariant prompt pieces, built once instead of per step.
+        capabilities = ", ".join(spec.capabilities or ["planning", "execution"])
+        self._persistent_instructions = (
+            f"Role: {spec.display_name}\n"
+            f"Mission: {spec.mission}\n"
+            f"Capabilities: {capabilities}\n"
+            f"{self._ACTION_SCHEMA_NOTE}"
+        )
+        self._session_context = (
+            f"Codex: Codex session pending.\n"
+            f"Check-ins every {spec.check_in_seconds} seconds."
+        )
         self.codex_session: Optional[CodexSessionModel] = None
-        self._task_queue: asyncio.Queue["WorkflowStep"] = asyncio.Queue()
-        self._runner: Optional[asyncio.Task[None]] = None
+        self._bridge: Optional[CodexBridge] = None
+        self._step_lock = asyncio.Lock()
 
     async def start(self) -> None:
-        self.codex_session = await self.orchestrator.create_codex_session(self.spec)
-        await self.boot(self._instructions)
+        self._bind_session(await self.orchestrator.create_codex_session(self.spec))
+        await self.boot(self._persistent_instructions)
         await self.notify(Channel.STATUS, {"event": "specialist_boot", "handle": self.spec.handle})
-        self._runner = asyncio.create_task(self._loop())
-
 
+    def _bind_session(self, session: CodexSessionModel) -> None:
+        """Attach a Codex session and refresh the cached per-step context.
 
+        The persistent instructions stay free of session state so the
+        provider can cache that prefix; only this context string changes
+        when the session rebinds.
+        """
 
-    @property
-    def _instructions(self) -> str:
-        session = self.codex_session
-        codex_info = (
-            f"Codex workspace: {session.workspace} (agent: {session.agent_name})." if session else "Codex session pending."
-        )
-        capabilities = ", ".join(self.spec.capabilities or ["planning", "execution"])
-        return (
-            f"Role: {self.spec.display_name}\n"
-            f"Mission: {self.spec.mission}\n"
-            f"Codex: {codex_info}\n"
-            f"Check-ins every {self.spec.check_in_seconds} seconds.\n"
-            f"Capabilities: {capabilities}\n"
-            'When you produce actions, respond with JSON using the schema {"actions": [{"tool": str, "arguments": dict}]}.'
+        self.codex_session = session
+        self._session_context = (
+            f"Codex: Codex workspace: {session.workspace} (agent: {session.agent_name}).\n"
+            f"Check-ins every {self.spec.check_in_seconds} seconds."
         )
 
-    async def receive_step(self, step: "WorkflowStep") -> None:
-        await self._task_queue.put(step)
+    async def _ensure_bridge(self) -> CodexBridge:
+        """Return the specialist's long-lived Codex bridge, connecting on first use.
+
+        One process per specialist lifetime amortizes the spawn and MCP
+        handshake cost across every step instead of paying it per step.
+        """
+
+        if self._bridge is None:
+            session = self.codex_session
+            if session is None:
+                session = await self.orchestrator.create_codex_session(self.spec)
+                self._bind_session(session)
+            self._bridge = CodexBridge(agent_name=session.agent_name, workspace=session.workspace)
+            await self._bridge.open()
+        return self._bridge
+
+    async def shutdown(self) -> None:
+        """Tear down the Codex bridge."""
 
-    async def _loop(self) -> None:
-        while True:
-            step = await self._task_queue.get()
+        if self._bridge is not None:
+            await self._bridge.close()
+            self._bridge = None
+
+    async def execute_step(self, step: "WorkflowStep") -> None:
+        """Run a single step, reporting failures on the alert channel.
+
+        Steps are serialized per specialist: the underlying Assistants
+        thread only allows one active run, so concurrent layers must not
+        overlap on the same agent.
+        """
+
+        async with self._step_lock:
             try:
                 await self._execute_step(step)
             except Exception as exc:  # pragma: no cover - defensive
@@ -103,28 +141,34 @@ class SpecialistAgent(BaseAgent):
             },
         )
         prompt = (
+            f"{self._session_context}\n"
             f"Task: {step.description}\n"
             f"Dependencies: {', '.join(step.depends_on) if step.depends_on else 'none'}\n"
-            "Respond with JSON specifying Codex actions to take."
+            f"{self._STEP_PROMPT_SUFFIX}"
         )
         response = await self.send_model_message(prompt, metadata={"step": step.name})
         actions = self._parse_actions(response)
-        session = self.codex_session or await self.orchestrator.create_codex_session(self.spec)
-        async with CodexBridge(agent_name=session.agent_name, workspace=session.workspace) as bridge:
-            for action in actions:
-                tool = action.get("tool")
-                kwargs = action.get("arguments", {})
-                result = await self._dispatch_tool(bridge, tool, kwargs)
-                await self.notify(
-                    Channel.ARTIFACT,
-                    {
-                        "event": "codex_action",
-                        "handle": self.spec.handle,
-                        "step": step.name,
-                        "tool": tool,
-                        "result": result.data,
-                    },
-                )
+        bridge = await self._ensure_bridge()
+        # One batched MCP round trip instead of one per action; the plan
+        # DAG already sequences dependent work at step granularity.
+        ops = []
+        for action in actions:
+            tool = action.get("tool")
+            if tool not in self._KNOWN_TOOLS:
+                raise ValueError(f"Unknown tool requested by specialist: {tool}")
+            ops.append((tool, action.get("arguments", {})))
+        results = await bridge.request_batch(ops) if ops else []
+        for action, result in zip(actions, results):
+            await self.notify(
+                Channel.ARTIFACT,
+                {
+                    "event": "codex_action",
+                    "handle": self.spec.handle,
+                    "step": step.name,
+                    "tool": action.get("tool"),
+                    "result": result.data,
+                },
+            )
         await self.notify(
             Channel.STATUS,
             {
@@ -135,27 +179,19 @@ class SpecialistAgent(BaseAgent):
         )
 
     def _parse_actions(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        # Messages arrive newest first from AgentsClient.send_message as
+        # SDK model objects, so attribute access replaces dict lookups.
         messages = response.get("messages", [])
-        for message in reversed(messages):
-            for item in message.get("content", []):
-                if item.get("type") == "output_text":
-                    try:
-                        data = json.loads(item.get("text", ""))
-                    except json.JSONDecodeError:
+        for message in messages:
+            for item in message.content or []:
+                if item.type == "output_text":
+                    data = find_json_object(item.text or "")
+                    if not isinstance(data, dict):
                         continue
                     actions = data.get("actions")
                     if isinstance(actions, list):
                         return actions
         return []
 
-    async def _dispatch_tool(self, bridge: CodexBridge, tool: str, kwargs: Dict[str, Any]) -> Any:
-        if tool == "run_command":
-            return await bridge.run_command(kwargs.get("command", ""))
-        if tool == "read_file":
-            return await bridge.read_file(kwargs.get("path", ""))
-        if tool == "apply_patch":
-            return await bridge.apply_patch(kwargs.get("path", ""), kwargs.get("patch", ""))
-        raise ValueError(f"Unknown tool requested by specialist: {tool}")
-
 
 __all__ = ["SpecialistAgent", "SpecialistSpec"]
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import os
-import subprocess
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from pydantic import BaseModel
 
 from .config import get_settings
@@ -30,97 +30,276 @@ class CodexResponse:
 class CodexBridge:
     """Manages a Codex CLI MCP session for a single specialist."""
 
+    # Tools whose responses may be served from cache; all are read-only.
+    _CACHEABLE_TOOLS = frozenset({"read_file"})
+
+    # Static envelope fragments per known tool: only the id and kwargs vary
+    # per call, so most of the encode work is done once at class load.
+    _ENVELOPE_SEGMENTS = {
+        tool: b',"tool":"' + tool.encode() + b'","kwargs":'
+        for tool in ("run_command", "read_file", "apply_patch")
+    }
+
     def __init__(self, agent_name: str, workspace: str) -> None:
         self.agent_name = agent_name
         self.workspace = workspace
-        self._process: Optional[subprocess.Popen[bytes]] = None
+        settings = get_settings()
+        self._cmd = [settings.codex_binary_path or "codex", "cli", "mcp"]
+        self._process: Optional[asyncio.subprocess.Process] = None
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
         self._lock = asyncio.Lock()
+        self._cache: Dict[str, CodexResponse] = {}
+        self._next_id = 0
+        self._pending: Dict[int, "asyncio.Future[tuple[Dict[str, Any], str]]"] = {}
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        self._stderr_task: Optional[asyncio.Task[None]] = None
 
     async def __aenter__(self) -> "CodexBridge":
-        await self._start()
+        await self.open()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
         await self.close()
 
+    async def open(self) -> None:
+        """Connect to Codex CLI if not already connected."""
+
+        if self._process is None:
+            await self._start()
+
     async def _start(self) -> None:
         """Boot the Codex CLI process and connect pipes."""
 
-        settings = get_settings()
         os.makedirs(self.workspace, exist_ok=True)
 
-        cmd = [settings.codex_binary_path or "codex", "cli", "mcp"]
+        cmd = self._cmd
         env = os.environ.copy()
         env.setdefault("CODEX_AGENT_NAME", self.agent_name)
 
-        self._process = subprocess.Popen(
-            cmd,
+        self._process = await asyncio.create_subprocess_exec(
+            *cmd,
             cwd=self.workspace,
             env=env,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
         if not self._process.stdin or not self._process.stdout:
             raise CodexError("Failed to initialize Codex CLI pipes")
-        loop = asyncio.get_running_loop()
-        self._reader = asyncio.StreamReader()
-        protocol = asyncio.StreamReaderProtocol(self._reader)
-        await loop.connect_read_pipe(lambda: protocol, self._process.stdout)
-        self._writer = asyncio.StreamWriter(
-            self._process.stdin,
-            protocol,
-            self._reader,
-            loop,
-        )
+        self._reader = self._process.stdout
+        self._writer = self._process.stdin
+        self._reader_task = asyncio.create_task(self._read_frames())
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
+
+    async def _read_frames(self) -> None:
+        """Consume length-prefixed response frames and resolve pending requests.
+
+        Frames are `Content-Length: N\\r\\n\\r\\n<N bytes>` (MCP framing);
+        each body carries the `id` of the request it answers, so responses
+        may arrive in any order and requests can be pipelined.
+
+        A malformed frame kills the reader: the stream offset can no longer
+        be trusted, so the bridge is marked disconnected and in-flight
+        requests fail instead of hanging on unresolvable futures.
+        """
+
+        assert self._reader is not None
+        try:
+            while True:
+                header = await self._reader.readline()
+                if not header:
+                    break
+                text = header.decode().strip()
+                if not text.lower().startswith("content-length:"):
+                    continue
+                length = int(text.split(":", 1)[1])
+                await self._reader.readline()  # blank separator line
+                body = await self._reader.readexactly(length)
+                self._resolve_frame(body)
+        except asyncio.CancelledError:
+            pass
+        except Exception:  # pragma: no cover - malformed frame or dead pipe
+            pass
+        finally:
+            # Disconnect so _roundtrip raises CodexError up front rather
+            # than awaiting a future nothing will ever resolve.
+            self._reader = None
+            self._writer = None
+            self._fail_pending(CodexError("Codex bridge connection closed"))
+
+    def _resolve_frame(self, body: bytes) -> None:
+        raw = body.decode()
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
+            raise CodexError(f"Invalid JSON from Codex: {raw}") from exc
+        future = self._pending.pop(data.get("id"), None)
+        if future is not None and not future.done():
+            future.set_result((data, raw))
+
+    def _fail_pending(self, error: CodexError) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def _drain_stderr(self) -> None:
+        """Discard child stderr so a full pipe cannot stall the Codex process."""
+
+        assert self._process is not None and self._process.stderr is not None
+        try:
+            while await self._process.stderr.read(65536):
+                pass
+        except asyncio.CancelledError:
+            pass
 
     async def close(self) -> None:
         """Terminate Codex CLI process gracefully."""
 
-        if self._writer:
-            self._writer.close()
-            await self._writer.wait_closed()
+        # The reader task clears _writer when it stops; grab the reference
+        # first so the pipe still gets closed cleanly.
+        writer = self._writer
+        tasks = [task for task in (self._reader_task, self._stderr_task) if task]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._reader_task = None
+        self._stderr_task = None
+        if writer:
+            writer.close()
+            await writer.wait_closed()
         if self._process:
             self._process.terminate()
             try:
-                await asyncio.wait_for(asyncio.to_thread(self._process.wait), timeout=5)
+                await asyncio.wait_for(self._process.wait(), timeout=5)
             except asyncio.TimeoutError:
                 self._process.kill()
         self._writer = None
         self._reader = None
         self._process = None
 
-    async def request(self, tool: str, **kwargs: Any) -> CodexResponse:
-        """Send a tool invocation request to Codex."""
+    def _cache_key(self, tool: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Build a cache key for `tool`, or None when the call must go to Codex.
+
+        For `read_file` the target's mtime and size are folded into the key
+        so edits on disk invalidate stale entries.
+        """
+
+        material: Dict[str, Any] = {"tool": tool, "kwargs": kwargs}
+        if tool == "read_file":
+            path = kwargs.get("path", "")
+            if not os.path.isabs(path):
+                path = os.path.join(self.workspace, path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            material["stat"] = [stat.st_mtime_ns, stat.st_size]
+        return hashlib.sha256(orjson.dumps(material, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    async def request(self, tool: str, cache: bool = True, **kwargs: Any) -> CodexResponse:
+        """Send a tool invocation request to Codex.
+
+        Responses for read-only tools are cached; pass `cache=False` to
+        force a round-trip.
+        """
+
+        key = None
+        if cache and tool in self._CACHEABLE_TOOLS:
+            key = self._cache_key(tool, kwargs)
+            if key is not None:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+        request_id = self._next_id
+        self._next_id += 1
+        segment = self._ENVELOPE_SEGMENTS.get(tool)
+        if segment is None:
+            segment = b',"tool":' + orjson.dumps(tool) + b',"kwargs":'
+        body = b'{"id":%d%s%s}' % (request_id, segment, orjson.dumps(kwargs))
+        data, raw = await self._roundtrip(request_id, body)
+        ok = bool(data.get("ok", False))
+        response = CodexResponse(ok=ok, data=data, raw=raw)
+        if key is not None and ok:
+            self._cache[key] = response
+        return response
+
+    async def request_batch(self, ops: List[Tuple[str, Dict[str, Any]]]) -> List[CodexResponse]:
+        """Execute several tool invocations in a single framed round trip.
+
+        Cacheable ops are served from the read cache first; the remainder
+        is sent as one `{"batch": [...]}` frame whose `results` list maps
+        1:1 onto the submitted ops, saving (K-1) RTTs for K actions.
+
+        Ops execute in order on the Codex side, so a read that follows a
+        mutating op within the same batch may observe that mutation — such
+        reads skip the cache entirely (both lookup and fill), since their
+        key would be computed against pre-batch file state.
+        """
+
+        responses: List[Optional[CodexResponse]] = [None] * len(ops)
+        keys: List[Optional[str]] = [None] * len(ops)
+        misses: List[int] = []
+        mutated = False
+        for index, (tool, kwargs) in enumerate(ops):
+            if tool not in self._CACHEABLE_TOOLS:
+                mutated = True
+                misses.append(index)
+                continue
+            if not mutated:
+                key = self._cache_key(tool, kwargs)
+                keys[index] = key
+                if key is not None:
+                    cached = self._cache.get(key)
+                    if cached is not None:
+                        responses[index] = cached
+                        continue
+            misses.append(index)
+        if misses:
+            request_id = self._next_id
+            self._next_id += 1
+            batch = [{"tool": ops[index][0], "kwargs": ops[index][1]} for index in misses]
+            body = b'{"id":%d,"batch":%s}' % (request_id, orjson.dumps(batch))
+            data, raw = await self._roundtrip(request_id, body)
+            results = data.get("results")
+            if not isinstance(results, list) or len(results) != len(misses):
+                raise CodexError(f"Malformed batch response from Codex: {raw}")
+            for index, entry in zip(misses, results):
+                ok = bool(entry.get("ok", False))
+                response = CodexResponse(ok=ok, data=entry, raw=orjson.dumps(entry).decode())
+                if keys[index] is not None and ok:
+                    self._cache[keys[index]] = response
+                responses[index] = response
+        return [response for response in responses if response is not None]
+
+    async def _roundtrip(self, request_id: int, body: bytes) -> Tuple[Dict[str, Any], str]:
+        """Write one framed request and await its matching response frame."""
 
         if not self._writer or not self._reader:
             raise CodexError("Codex bridge is not connected")
-        payload = {"tool": tool, "kwargs": kwargs}
-        message = json.dumps(payload) + "\n"
-        async with self._lock:
-            self._writer.write(message.encode())
-            await self._writer.drain()
-            raw_bytes = await self._reader.readline()
-        if not raw_bytes:
-            raise CodexError("Codex bridge returned empty response")
-        raw = raw_bytes.decode()
+        future: "asyncio.Future[tuple[Dict[str, Any], str]]" = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
         try:
-            data = json.loads(raw)
-        except json.JSONDecodeError as exc:  # pragma: no cover - defensive
-            raise CodexError(f"Invalid JSON from Codex: {raw}") from exc
-        ok = bool(data.get("ok", False))
-        return CodexResponse(ok=ok, data=data, raw=raw)
+            # The lock only covers the write phase; responses are matched to
+            # requests by id, so multiple calls stay in flight concurrently.
+            async with self._lock:
+                self._writer.write(b"Content-Length: %d\r\n\r\n" % len(body))
+                self._writer.write(body)
+                await self._writer.drain()
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
 
     async def run_command(self, command: str) -> CodexResponse:
-        return await self.request("run_command", command=command)
+        return await self.request("run_command", cache=False, command=command)
 
     async def read_file(self, path: str) -> CodexResponse:
         return await self.request("read_file", path=path)
 
     async def apply_patch(self, path: str, patch: str) -> CodexResponse:
-        return await self.request("apply_patch", path=path, patch=patch)
+        return await self.request("apply_patch", cache=False, path=path, patch=patch)
 
 
 class CodexSessionModel(BaseModel):
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from collections import deque
 from enum import Enum
-from typing import Any, AsyncIterator, Dict, List, Set
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import msgspec
+
+from .config import get_settings
 
 
 class Channel(str, Enum):
@@ -18,54 +22,131 @@ class Channel(str, Enum):
     HEARTBEAT = "heartbeat"
 
 
-@dataclass
-class Message:
-    """Represents a payload published on the bus."""
+class Message(msgspec.Struct, frozen=True):
+    """Represents a payload published on the bus.
+
+    A slotted msgspec Struct: cheaper to allocate than a dataclass on the
+    per-publish hot path and smaller when snapshots retain many messages.
+    """
 
     channel: Channel
     sender: str
     payload: Dict[str, Any]
 
 
+class _SubscriberQueue(asyncio.Queue):
+    """Bounded subscriber queue backed by a deque we own.
+
+    The `_init`/`_put`/`_get` hooks are asyncio.Queue's sanctioned storage
+    extension points; `qsize()`/`empty()`/`full()` still read `_queue`, so
+    the deque must live under that name. Owning the hooks is what makes
+    `snapshot` safe against Queue internals changing.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: "deque[Message]" = deque()
+
+    def _put(self, item: Message) -> None:
+        self._queue.append(item)
+
+    def _get(self) -> Message:
+        return self._queue.popleft()
+
+    def snapshot(self) -> List[Message]:
+        return list(self._queue)
+
+
 class PubSubBus:
     """Async publish/subscribe message bus."""
 
-    def __init__(self) -> None:
-        self._subscribers: Dict[Channel, Set[asyncio.Queue[Message]]] = {
-            channel: set() for channel in Channel
+    # Channels where every message matters: a full subscriber queue blocks
+    # the producer instead of shedding the oldest entry.
+    _BLOCKING_CHANNELS = frozenset({Channel.ALERT, Channel.PLAN})
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        # Copy-on-write: each channel maps to an immutable tuple that is
+        # rebuilt under `_lock` on (un)subscribe, so readers never lock.
+        self._subscribers: Dict[Channel, Tuple[_SubscriberQueue, ...]] = {
+            channel: () for channel in Channel
+        }
+        self._callbacks: Dict[Channel, Tuple[Callable[[Message], None], ...]] = {
+            channel: () for channel in Channel
         }
         self._lock = asyncio.Lock()
+        self._maxsize = maxsize if maxsize is not None else get_settings().bus_queue_maxsize
+        self.dropped: Dict[Channel, int] = {channel: 0 for channel in Channel}
 
     async def publish(self, message: Message) -> None:
-        """Publish `message` to all channel subscribers."""
-
-        async with self._lock:
-            queues = list(self._subscribers.get(message.channel, set()))
-        for queue in queues:
-            await queue.put(message)
+        """Publish `message` to all channel subscribers.
+
+        Queues are bounded; on overflow, telemetry-style channels drop
+        their oldest entry (counted in `dropped`) while alert/plan
+        channels apply backpressure to the producer.
+        """
+
+        channel = message.channel
+        for queue in self._subscribers[channel]:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                if channel in self._BLOCKING_CHANNELS:
+                    await queue.put(message)
+                    continue
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:  # pragma: no cover - racy consumer
+                    pass
+                else:
+                    self.dropped[channel] += 1
+                try:
+                    queue.put_nowait(message)
+                except asyncio.QueueFull:  # pragma: no cover - racy consumer
+                    self.dropped[channel] += 1
+        for callback in self._callbacks[channel]:
+            callback(message)
+
+    def subscribe_callback(self, channel: Channel, callback: Callable[[Message], None]) -> None:
+        """Invoke `callback` synchronously from `publish` for each message.
+
+        Cheaper than a queue subscriber for consumers that just record the
+        message: no queue, no task, no async-generator step per message.
+        """
+
+        self._callbacks[channel] = self._callbacks[channel] + (callback,)
+
+    def unsubscribe_callback(self, channel: Channel, callback: Callable[[Message], None]) -> None:
+        """Remove a callback registered with `subscribe_callback`.
+
+        Matching uses equality, not identity: bound methods are recreated
+        on every attribute access, so `is` would never match them.
+        """
+
+        self._callbacks[channel] = tuple(
+            cb for cb in self._callbacks[channel] if cb != callback
+        )
 
     async def subscribe(self, channel: Channel) -> AsyncIterator[Message]:
         """Yield messages for subscribers to `channel`. Caller must consume messages."""
 
-        queue: asyncio.Queue[Message] = asyncio.Queue()
+        queue = _SubscriberQueue(maxsize=self._maxsize)
         async with self._lock:
-            self._subscribers[channel].add(queue)
+            self._subscribers[channel] = self._subscribers[channel] + (queue,)
         try:
             while True:
                 message = await queue.get()
                 yield message
         finally:
             async with self._lock:
-                self._subscribers[channel].discard(queue)
+                self._subscribers[channel] = tuple(
+                    q for q in self._subscribers[channel] if q is not queue
+                )
 
     async def snapshot(self, channel: Channel) -> List[Message]:
         """Return current queued messages for inspection (non-destructive)."""
 
-        async with self._lock:
-            queues = list(self._subscribers.get(channel, set()))
         messages: List[Message] = []
-        for queue in queues:
-            messages.extend(list(queue._queue))  # type: ignore[attr-defined]
+        for queue in self._subscribers[channel]:
+            messages.extend(queue.snapshot())
         return messages
 
 
@@ -27,6 +27,10 @@ class Settings(BaseSettings):
         default="gpt-4.1-mini",
         description="Default model identifier exposed by the proxy"
     )
+    max_rpm: int = Field(
+        default=300,
+        description="Client-side request-per-minute ceiling toward the LiteLLM proxy"
+    )
     litellm_custom_provider: Optional[str] = Field(
         default="openai",
         description="Optional LiteLLM custom_llm_provider override"
@@ -39,6 +43,18 @@ class Settings(BaseSettings):
         ),
         description="High-level instructions for the orchestrator agent"
     )
+    bus_queue_maxsize: int = Field(
+        default=1024,
+        description="Per-subscriber queue capacity on the pub/sub bus"
+    )
+    max_parallel_steps: int = Field(
+        default=4,
+        description="Maximum workflow steps executed concurrently across specialists"
+    )
+    plan_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse cached TeamPlans for goals the orchestrator has already planned"
+    )
     default_check_in_seconds: int = Field(
         default=300,
         description="Fallback cadence for specialist status reports"
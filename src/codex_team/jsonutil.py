@@ -0,0 +1,61 @@
+"""Fast JSON parsing helpers for model output."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import orjson
+
+
+def loads(text: str) -> Any:
+    """Parse JSON with orjson (C parser, ~3-5x faster than stdlib)."""
+
+    return orjson.loads(text)
+
+
+def find_json_object(text: str) -> Optional[Any]:
+    """Parse the last JSON object embedded in `text`, or None.
+
+    Model replies often wrap the payload in prose. The whole text is tried
+    first; failing that, a single string-aware scan collects balanced
+    `{...}` spans and candidates are parsed from the last one backwards.
+    """
+
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+    spans = []
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char == "{":
+            if depth == 0:
+                start = index
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if depth == 0 and start != -1:
+                spans.append((start, index + 1))
+                start = -1
+    for begin, end in reversed(spans):
+        try:
+            return orjson.loads(text[begin:end])
+        except orjson.JSONDecodeError:
+            continue
+    return None
+
+
+__all__ = ["loads", "find_json_object"]
@@ -0,0 +1,96 @@
+"""Optional aiohttp-backed HTTP transport for the OpenAI client.
+
+httpx's AsyncClient degrades badly under high concurrency; routing requests
+through aiohttp keeps throughput flat as concurrent runs grow. aiohttp is an
+optional dependency (the `perf` extra) — when it is missing we fall back to
+the SDK's default client.
+"""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Optional
+
+import httpx
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+
+class _AiohttpByteStream(httpx.AsyncByteStream):
+    """Adapts an aiohttp response body to httpx's stream interface."""
+
+    def __init__(self, response: "aiohttp.ClientResponse") -> None:
+        self._response = response
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._response.content.iter_chunked(65536):
+            yield chunk
+
+    async def aclose(self) -> None:
+        self._response.release()
+
+
+class AioTransport(httpx.AsyncBaseTransport):
+    """httpx transport that proxies requests through a shared aiohttp session."""
+
+    def __init__(self) -> None:
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None:
+            # limit=0 removes the per-host connection cap; auto_decompress is
+            # disabled so httpx handles Content-Encoding itself.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, force_close=False),
+                auto_decompress=False,
+            )
+        return self._session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        session = await self._get_session()
+        # httpx exposes raw headers as (bytes, bytes) pairs; aiohttp's
+        # multidict only accepts str keys.
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in request.headers.raw
+        ]
+        response = await session.request(
+            request.method,
+            str(request.url),
+            headers=headers,
+            data=request.content,
+            allow_redirects=False,
+        )
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers.items(),
+            stream=_AiohttpByteStream(response),
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """Return the tuned HTTP client for talking to the LiteLLM proxy.
+
+    With aiohttp installed, requests go through AioTransport. Otherwise a
+    plain httpx client is used with HTTP/2 enabled so concurrent requests
+    multiplex over one TLS connection instead of churning sockets.
+    """
+
+    if aiohttp is not None:
+        return httpx.AsyncClient(transport=AioTransport())
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+
+__all__ = ["AioTransport", "build_http_client"]
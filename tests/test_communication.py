@@ -0,0 +1,69 @@
+"""Tests for the pub/sub bus."""
+
+import asyncio
+
+import pytest
+
+from codex_team.communication import Channel, Message, PubSubBus
+
+
+def _message(channel: Channel, index: int = 0) -> Message:
+    return Message(channel=channel, sender="tester", payload={"index": index})
+
+
+@pytest.mark.asyncio
+async def test_subscribe_round_trip():
+    bus = PubSubBus(maxsize=4)
+    received = asyncio.Queue()
+
+    async def consume():
+        async for message in bus.subscribe(Channel.STATUS):
+            await received.put(message)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)  # let the subscriber register
+    sent = _message(Channel.STATUS)
+    await bus.publish(sent)
+    got = await asyncio.wait_for(received.get(), timeout=1)
+    assert got is sent
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_overflow_drops_oldest_on_status():
+    bus = PubSubBus(maxsize=2)
+
+    async def consume():
+        async for _ in bus.subscribe(Channel.STATUS):
+            await asyncio.sleep(3600)  # stalled consumer
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    for index in range(4):
+        await bus.publish(_message(Channel.STATUS, index))
+    snapshot = await bus.snapshot(Channel.STATUS)
+    assert [message.payload["index"] for message in snapshot] == [2, 3]
+    assert bus.dropped[Channel.STATUS] == 2
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_callback_subscribers_fire_and_unsubscribe():
+    bus = PubSubBus(maxsize=4)
+    seen = []
+
+    class Recorder:
+        def record(self, message: Message) -> None:
+            seen.append(message)
+
+    recorder = Recorder()
+    bus.subscribe_callback(Channel.ALERT, recorder.record)
+    sent = _message(Channel.ALERT)
+    await bus.publish(sent)
+    assert seen == [sent]
+    # Bound methods are fresh objects per access; unsubscribe must still match.
+    bus.unsubscribe_callback(Channel.ALERT, recorder.record)
+    await bus.publish(_message(Channel.ALERT, 1))
+    assert len(seen) == 1